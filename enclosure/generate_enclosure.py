@@ -14,9 +14,29 @@
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import math
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; pure-Python fallbacks below
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to a no-op decorator
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
 
 # ---------------------------------------------------------------------------
 # Enclosure parameters (all dimensions in millimetres)
@@ -75,34 +95,115 @@ LIP_THICKNESS = 1.0                 # rim wall thickness
 # Export directory (same folder as this script)
 EXPORT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+
+# ---------------------------------------------------------------------------
+# Derived feature positions (computed once at import)
+# ---------------------------------------------------------------------------
+
+def _distribute(count: int, total_length: float,
+                item_width: float) -> list[float]:
+    """Return *count* evenly-spaced X positions centred on 0, with items of
+    *item_width* fitting comfortably inside *total_length*.
+
+    Uses numpy.linspace when available so repeated calls with the same
+    arguments yield bit-identical floats (and larger feature arrays stay a
+    single vectorized call); falls back to pure Python otherwise.
+    """
+    if count == 1:
+        return [0.0]
+    usable = total_length - 2 * WALL_THICKNESS - item_width
+    start = -usable / 2
+    if np is not None:
+        return np.linspace(start, start + usable, count).tolist()
+    spacing = usable / (count - 1)
+    return [start + i * spacing for i in range(count)]
+
+
+if np is not None:
+    @njit(cache=True)
+    def _grid_positions(nx: int, ny: int, dx: float, dy: float):
+        """Return an (nx*ny, 2) array of grid positions centred on 0.
+
+        Numeric extension point for configurable standoff/vent lattices:
+        JIT-compiled (and disk-cached) when numba is installed, plain
+        numpy otherwise.  The current fixed 4-standoff layout stays on the
+        hand-written tuples below — for a handful of positions the JIT
+        dispatch overhead exceeds the loop cost.
+        """
+        out = np.empty((nx * ny, 2), dtype=np.float64)
+        x0 = -(nx - 1) * dx / 2
+        y0 = -(ny - 1) * dy / 2
+        k = 0
+        for i in range(nx):
+            for j in range(ny):
+                out[k, 0] = x0 + i * dx
+                out[k, 1] = y0 + j * dy
+                k += 1
+        return out
+
+
+# Shared between the shell and lid builders so both halves use bit-identical
+# float coordinates — OCCT's vertex-merge tolerance never has to reconcile
+# near-duplicate positions when the parts are assembled.
+EAR_POSITIONS_X = tuple(_distribute(NUM_EARS_PER_SIDE, OUTER_LENGTH,
+                                    MOUNTING_EAR_WIDTH))
+CLIP_POSITIONS_X = tuple(_distribute(NUM_CLIPS_PER_LONG_SIDE, OUTER_LENGTH,
+                                     CLIP_WIDTH))
+
+_PCB_OFFSET_X = PCB_LENGTH / 2 - 2.5   # 2.5 mm inboard from board edge
+_PCB_OFFSET_Y = PCB_WIDTH / 2 - 2.5
+STANDOFF_POSITIONS = (
+    (_PCB_OFFSET_X, _PCB_OFFSET_Y),
+    (_PCB_OFFSET_X, -_PCB_OFFSET_Y),
+    (-_PCB_OFFSET_X, _PCB_OFFSET_Y),
+    (-_PCB_OFFSET_X, -_PCB_OFFSET_Y),
+)
+
 # ---------------------------------------------------------------------------
 # FreeCAD import gate
 # ---------------------------------------------------------------------------
 
 FREECAD_AVAILABLE = False
 
-try:
+# Probe with find_spec before attempting the real import: a failed
+# `import FreeCAD` still walks sys.path and scans .pth files, which costs
+# tens of ms on systems without FreeCAD where this script is just a
+# dry-run.  SENSEEDGE_NO_FREECAD=1 forces the dry-run path even when
+# FreeCAD is installed.
+if (os.environ.get("SENSEEDGE_NO_FREECAD") is None
+        and importlib.util.find_spec("FreeCAD") is not None):
     import FreeCAD  # type: ignore[import-untyped]
     import Part  # type: ignore[import-untyped]
     from FreeCAD import Base  # type: ignore[import-untyped]
 
     FREECAD_AVAILABLE = True
-except ImportError:
-    pass
+
+    # Hoisted axis vectors: Base.Vector allocates a new wrapper object per
+    # call and these two never change, so share one instance across every
+    # arc/cylinder construction.
+    _Z_AXIS = Base.Vector(0, 0, 1)
+    _X_AXIS = Base.Vector(1, 0, 0)
 
 
 # ---------------------------------------------------------------------------
 # Helper geometry functions
 # ---------------------------------------------------------------------------
 
-def _rounded_rect_wire(length: float, width: float, radius: float,
-                       z: float = 0.0) -> "Part.Wire":
-    """Return a closed wire for a rounded rectangle centred on the XY origin
-    at height *z*.  *length* is along X, *width* along Y."""
+@functools.lru_cache(maxsize=64)
+def _rounded_rect_wire_cached(length: float, width: float,
+                              radius: float) -> "Part.Wire":
+    """Build (and memoize) a closed rounded-rectangle wire at z=0.
+
+    The same (length, width, radius) triple is requested several times per
+    run (outer shell, cavity and lip are each built for both halves), so the
+    wire is constructed once and callers translate copies of it.
+    """
     r = min(radius, length / 2, width / 2)
     hl, hw = length / 2, width / 2
 
-    edges: list[Part.Edge] = []
+    # Exactly 8 edges (4 lines + 4 arcs): preallocate and fill by index
+    # rather than growing the list with append.
+    edges: list[Part.Edge] = [None] * 8
 
     # Corner centres (CCW from bottom-right)
     corners = [
@@ -114,10 +215,10 @@ def _rounded_rect_wire(length: float, width: float, radius: float,
 
     # Straight segments between arcs (bottom, right, top, left)
     straights = [
-        ((-hl + r, -hw, z), (hl - r, -hw, z)),   # bottom edge
-        ((hl, -hw + r, z), (hl, hw - r, z)),      # right edge
-        ((hl - r, hw, z), (-hl + r, hw, z)),       # top edge
-        ((-hl, hw - r, z), (-hl, -hw + r, z)),     # left edge
+        ((-hl + r, -hw, 0.0), (hl - r, -hw, 0.0)),   # bottom edge
+        ((hl, -hw + r, 0.0), (hl, hw - r, 0.0)),      # right edge
+        ((hl - r, hw, 0.0), (-hl + r, hw, 0.0)),       # top edge
+        ((-hl, hw - r, 0.0), (-hl, -hw + r, 0.0)),     # left edge
     ]
 
     start_angles = [270, 0, 90, 180]
@@ -126,19 +227,40 @@ def _rounded_rect_wire(length: float, width: float, radius: float,
         # Straight segment
         p1 = Base.Vector(*straights[i][0])
         p2 = Base.Vector(*straights[i][1])
-        edges.append(Part.makeLine(p1, p2))
+        edges[2 * i] = Part.makeLine(p1, p2)
 
         # Arc
         cx, cy = corners[i]
-        centre = Base.Vector(cx, cy, z)
+        centre = Base.Vector(cx, cy, 0.0)
         sa = start_angles[i]
-        arc = Part.makeCircle(r, centre, Base.Vector(0, 0, 1), sa, sa + 90)
-        edges.append(Part.Edge(arc))
-
+        arc = Part.makeCircle(r, centre, _Z_AXIS, sa, sa + 90)
+        edges[2 * i + 1] = Part.Edge(arc)
+
+    # The edges are emitted tail-to-head already; run the connection sort
+    # explicitly once so the Wire constructor's internal adjacency solver
+    # gets a pre-chained list and does not re-derive the ordering.
+    if hasattr(Part, "sortEdges"):
+        edges = Part.sortEdges(edges)[0]
     wire = Part.Wire(edges)
     return wire
 
 
+def _rounded_rect_wire(length: float, width: float, radius: float,
+                       z: float = 0.0) -> "Part.Wire":
+    """Return a closed wire for a rounded rectangle centred on the XY origin
+    at height *z*.  *length* is along X, *width* along Y.
+
+    Returns a copy of the memoized z=0 wire so downstream extrude/face
+    construction never mutates the cached shape.  Keys are rounded to 1e-6
+    mm so float noise does not defeat the cache.
+    """
+    wire = _rounded_rect_wire_cached(round(length, 6), round(width, 6),
+                                     round(radius, 6)).copy()
+    if z:
+        wire.translate(Base.Vector(0, 0, z))
+    return wire
+
+
 def _rounded_rect_face(length: float, width: float, radius: float,
                        z: float = 0.0) -> "Part.Face":
     """Convenience: face from rounded rectangle wire."""
@@ -164,6 +286,66 @@ def _cylinder_hole(x: float, y: float, z: float, dia: float,
     return _cylinder(x, y, z, dia, depth)
 
 
+# Fuzzy tolerance (mm) for the boolean retry path.  Loosens OCCT's vertex
+# matching where nominally coincident geometry does not share exact floats,
+# e.g. the 1.2 mm clip tabs sitting on the 2.0 mm inner wall face.
+_BOOLEAN_FUZZ = 1e-4
+
+
+def _checked_boolean(base: "Part.Shape", op_name: str,
+                     tools: "list[Part.Shape]") -> "Part.Shape":
+    """Run an n-ary fuse/cut and verify the result is still a solid.
+
+    Ill-conditioned booleans can silently return degenerate shapes instead
+    of raising; when that happens, retry once with a fuzzy tolerance so the
+    build fails loudly only if even the loosened pass cannot recover.
+    """
+    result = getattr(base, op_name)(tools)
+    if not result.Solids:
+        print(f"  WARNING: {op_name} returned no solid; retrying with "
+              f"fuzzy tolerance {_BOOLEAN_FUZZ} mm")
+        result = getattr(base, op_name)(tools, _BOOLEAN_FUZZ)
+        if not result.Solids:
+            raise RuntimeError(
+                f"boolean {op_name} failed even with fuzzy tolerance")
+    return result
+
+
+def _annular_prism(x: float, y: float, z: float, outer_dia: float,
+                   inner_dia: float, height: float) -> "Part.Shape":
+    """Hollow post at (x, y, z): an annular 2D face extruded upward.
+
+    The hole is part of the 2D profile (cheap planar boolean inside the
+    face builder), so the prism needs no 3D cut afterwards.
+    """
+    centre = Base.Vector(x, y, z)
+    outer = Part.Wire(Part.makeCircle(outer_dia / 2, centre))
+    inner = Part.Wire(Part.makeCircle(inner_dia / 2, centre))
+    face = Part.Face([outer, inner])
+    return face.extrude(Base.Vector(0, 0, height))
+
+
+def _ear_prism(cx: float, cy: float, z: float) -> "Part.Shape":
+    """Mounting ear with its bolt hole, built as one extruded prism.
+
+    Rectangular footprint centred on (cx, cy) with the M3 clearance hole
+    already present in the 2D profile — no per-ear 3D booleans.
+    """
+    hw = MOUNTING_EAR_WIDTH / 2
+    he = MOUNTING_EAR_EXTENSION / 2
+    outline = Part.makePolygon([
+        Base.Vector(cx - hw, cy - he, z),
+        Base.Vector(cx + hw, cy - he, z),
+        Base.Vector(cx + hw, cy + he, z),
+        Base.Vector(cx - hw, cy + he, z),
+        Base.Vector(cx - hw, cy - he, z),
+    ])
+    hole = Part.Wire(Part.makeCircle(MOUNTING_HOLE_DIA / 2,
+                                     Base.Vector(cx, cy, z)))
+    face = Part.Face([outline, hole])
+    return face.extrude(Base.Vector(0, 0, MOUNTING_EAR_THICKNESS))
+
+
 # ---------------------------------------------------------------------------
 # Bottom shell builder
 # ---------------------------------------------------------------------------
@@ -183,61 +365,54 @@ def build_bottom_shell() -> "Part.Shape":
     cavity = _rounded_box(inner_length, inner_width,
                           BOTTOM_HEIGHT - WALL_THICKNESS,
                           inner_radius, WALL_THICKNESS)
-    shell = outer.cut(cavity)
 
-    # 3. Sealing lip (rim around inner top edge for lid to sit into)
-    lip_outer = _rounded_box(inner_length, inner_width, LIP_HEIGHT,
-                             inner_radius, BOTTOM_HEIGHT)
+    # All additive/subtractive tools are collected first and applied in a
+    # strict fuse-then-cut grouping at the end: consecutive booleans that
+    # share the same object argument let OCCT reuse its intersection
+    # caches, and each n-ary operation runs a single PaveFiller over all
+    # tools instead of one full pipeline per primitive.
+    additives: list[Part.Shape] = []
+    subtractives: list[Part.Shape] = []
+
+    # 3. Sealing lip (rim around inner top edge for lid to sit into).
+    # Built as a ring profile — outer rounded-rect wire with the inner wire
+    # as a hole — extruded once, so the outer-minus-inner 3D boolean of the
+    # old two-step construction disappears.
     lip_inner_l = inner_length - 2 * LIP_THICKNESS
     lip_inner_w = inner_width - 2 * LIP_THICKNESS
     lip_inner_r = max(inner_radius - LIP_THICKNESS, 0.3)
-    lip_cavity = _rounded_box(lip_inner_l, lip_inner_w, LIP_HEIGHT,
-                              lip_inner_r, BOTTOM_HEIGHT)
-    lip = lip_outer.cut(lip_cavity)
-    shell = shell.fuse(lip)
-
-    # 4. Mounting ears (2 per long side, on the +Y and -Y faces)
+    lip_face = Part.Face([
+        _rounded_rect_wire(inner_length, inner_width, inner_radius,
+                           BOTTOM_HEIGHT),
+        _rounded_rect_wire(lip_inner_l, lip_inner_w, lip_inner_r,
+                           BOTTOM_HEIGHT),
+    ])
+    lip = lip_face.extrude(Base.Vector(0, 0, LIP_HEIGHT))
+    additives.append(lip)
+
+    # All four ears are identical, as are all four standoffs, clips and all
+    # six vent slots: build each prototype once and place O(1) translated
+    # copies (a translation only updates the shape's TopLoc_Location, the
+    # underlying geometry is shared).
+
+    # 4. Mounting ears (2 per long side, on the +Y and -Y faces).  The bolt
+    # hole is part of the extruded 2D profile, so no separate cut is needed.
     ear_z = 0.0
-    ear_positions_x = _distribute(NUM_EARS_PER_SIDE, OUTER_LENGTH,
-                                  MOUNTING_EAR_WIDTH)
+    ear_proto = _ear_prism(0.0, 0.0, ear_z)
 
     for side_sign in (1, -1):  # +Y and -Y
-        for ex in ear_positions_x:
-            # Ear centre in Y just outside the body
-            ey = side_sign * (OUTER_WIDTH / 2 + MOUNTING_EAR_EXTENSION / 2)
-            ear_box = Part.makeBox(
-                MOUNTING_EAR_WIDTH, MOUNTING_EAR_EXTENSION,
-                MOUNTING_EAR_THICKNESS,
-                Base.Vector(ex - MOUNTING_EAR_WIDTH / 2,
-                            ey - MOUNTING_EAR_EXTENSION / 2,
-                            ear_z))
-            shell = shell.fuse(ear_box)
-
-            # Through-hole
-            hole_centre_y = side_sign * (OUTER_WIDTH / 2
-                                         + MOUNTING_EAR_EXTENSION / 2)
-            hole = _cylinder_hole(ex, hole_centre_y, ear_z,
-                                  MOUNTING_HOLE_DIA,
-                                  MOUNTING_EAR_THICKNESS)
-            shell = shell.cut(hole)
-
-    # 5. PCB standoffs
-    pcb_offset_x = PCB_LENGTH / 2 - 2.5   # 2.5 mm inboard from board edge
-    pcb_offset_y = PCB_WIDTH / 2 - 2.5
-    standoff_positions = [
-        (pcb_offset_x, pcb_offset_y),
-        (pcb_offset_x, -pcb_offset_y),
-        (-pcb_offset_x, pcb_offset_y),
-        (-pcb_offset_x, -pcb_offset_y),
-    ]
-
-    for sx, sy in standoff_positions:
-        post = _cylinder(sx, sy, WALL_THICKNESS, STANDOFF_OUTER_DIA,
-                         STANDOFF_HEIGHT)
-        shell = shell.fuse(post)
-        tap_hole = _cylinder_hole(sx, sy, WALL_THICKNESS, STANDOFF_HOLE_DIA,
-                                  STANDOFF_HEIGHT)
-        shell = shell.cut(tap_hole)
+        # Ear centre in Y just outside the body
+        ey = side_sign * (OUTER_WIDTH / 2 + MOUNTING_EAR_EXTENSION / 2)
+        for ex in EAR_POSITIONS_X:
+            additives.append(ear_proto.translated(Base.Vector(ex, ey, 0)))
+
+    # 5. PCB standoffs: hollow post, annular profile extruded once with the
+    # tap hole included.
+    standoff_proto = _annular_prism(0.0, 0.0, WALL_THICKNESS,
+                                    STANDOFF_OUTER_DIA, STANDOFF_HOLE_DIA,
+                                    STANDOFF_HEIGHT)
+    for sx, sy in STANDOFF_POSITIONS:
+        additives.append(standoff_proto.translated(Base.Vector(sx, sy, 0)))
 
     # 6. Cable gland hole (centred on the -X short face)
     gland_x = -OUTER_LENGTH / 2
@@ -246,45 +421,53 @@ def build_bottom_shell() -> "Part.Shape":
     gland_cyl = Part.makeCylinder(
         CABLE_GLAND_DIA / 2, WALL_THICKNESS * 3,
         Base.Vector(gland_x - WALL_THICKNESS, gland_y, gland_z),
-        Base.Vector(1, 0, 0))
-    shell = shell.cut(gland_cyl)
-
-    # 7. Ventilation slots on each short side (-X and +X faces)
-    for x_sign in (-1, 1):
-        slot_x = x_sign * OUTER_LENGTH / 2
-        total_span = (VENT_SLOT_COUNT - 1) * VENT_SLOT_SPACING
-        for i in range(VENT_SLOT_COUNT):
-            sy = -total_span / 2 + i * VENT_SLOT_SPACING
-            sz = VENT_SLOT_Z_BOTTOM
-            # Slot as a thin box punched through the wall
-            slot = Part.makeBox(
-                WALL_THICKNESS * 3, VENT_SLOT_WIDTH, VENT_SLOT_LENGTH,
-                Base.Vector(slot_x - WALL_THICKNESS * 1.5,
-                            sy - VENT_SLOT_WIDTH / 2, sz))
-            shell = shell.cut(slot)
-
-    # 8. Snap-fit clip tabs (protruding hooks on outside of long walls)
-    clip_positions_x = _distribute(NUM_CLIPS_PER_LONG_SIDE, OUTER_LENGTH,
-                                   CLIP_WIDTH)
+        _X_AXIS)
+    subtractives.append(gland_cyl)
+
+    # 7. Ventilation slots on each short side (-X and +X faces): thin boxes
+    # punched through the wall, built as one tool batch so the single n-ary
+    # cut shares intersection search across the whole slot array.
+    total_span = (VENT_SLOT_COUNT - 1) * VENT_SLOT_SPACING
+    slot_proto = Part.makeBox(
+        WALL_THICKNESS * 3, VENT_SLOT_WIDTH, VENT_SLOT_LENGTH,
+        Base.Vector(-WALL_THICKNESS * 1.5, -VENT_SLOT_WIDTH / 2,
+                    VENT_SLOT_Z_BOTTOM))
+    subtractives.extend(
+        slot_proto.translated(
+            Base.Vector(x_sign * OUTER_LENGTH / 2,
+                        -total_span / 2 + i * VENT_SLOT_SPACING, 0))
+        for x_sign in (-1, 1)
+        for i in range(VENT_SLOT_COUNT))
+
+    # 8. Snap-fit clip tabs (protruding hooks on outside of long walls).
+    # One tab+hook prototype per wall side (the hook faces inward, so the
+    # two sides are not pure translations of each other), copied along X.
     for side_sign in (1, -1):
-        for cx in clip_positions_x:
-            cy_base = side_sign * (OUTER_WIDTH / 2 - WALL_THICKNESS)
-            # Tab body (thin vertical strip on inner wall)
-            tab = Part.makeBox(
-                CLIP_WIDTH, CLIP_THICKNESS, CLIP_HEIGHT + 2,
-                Base.Vector(cx - CLIP_WIDTH / 2,
-                            cy_base - (CLIP_THICKNESS / 2 if side_sign > 0
-                                       else CLIP_THICKNESS / 2),
-                            BOTTOM_HEIGHT - CLIP_HEIGHT - 2))
-            # Hook nub at top of tab (protrudes inward)
-            hook = Part.makeBox(
-                CLIP_WIDTH, CLIP_DEPTH, CLIP_HEIGHT,
-                Base.Vector(cx - CLIP_WIDTH / 2,
-                            (cy_base - CLIP_DEPTH if side_sign > 0
-                             else cy_base),
-                            BOTTOM_HEIGHT - CLIP_HEIGHT))
-            clip = tab.fuse(hook)
-            shell = shell.fuse(clip)
+        cy_base = side_sign * (OUTER_WIDTH / 2 - WALL_THICKNESS)
+        # Tab body (thin vertical strip on inner wall)
+        tab_proto = Part.makeBox(
+            CLIP_WIDTH, CLIP_THICKNESS, CLIP_HEIGHT + 2,
+            Base.Vector(-CLIP_WIDTH / 2,
+                        cy_base - CLIP_THICKNESS / 2,
+                        BOTTOM_HEIGHT - CLIP_HEIGHT - 2))
+        # Hook nub at top of tab (protrudes inward)
+        hook_proto = Part.makeBox(
+            CLIP_WIDTH, CLIP_DEPTH, CLIP_HEIGHT,
+            Base.Vector(-CLIP_WIDTH / 2,
+                        (cy_base - CLIP_DEPTH if side_sign > 0
+                         else cy_base),
+                        BOTTOM_HEIGHT - CLIP_HEIGHT))
+        for cx in CLIP_POSITIONS_X:
+            offset = Base.Vector(cx, 0, 0)
+            additives.append(tab_proto.translated(offset))
+            additives.append(hook_proto.translated(offset))
+
+    # Apply phase: hollow the outer block first — the standoff posts and
+    # clip tabs occupy cavity volume, so the cavity cut cannot join the
+    # batched subtractives — then one n-ary fuse followed by one n-ary cut.
+    shell = outer.cut(cavity)
+    shell = _checked_boolean(shell, "fuse", additives)
+    shell = _checked_boolean(shell, "cut", subtractives)
 
     return shell
 
@@ -310,19 +493,19 @@ def build_lid() -> "Part.Shape":
     cavity_height = LID_HEIGHT - WALL_THICKNESS
     cavity = _rounded_box(inner_length, inner_width, cavity_height,
                           inner_radius, z_base)
-    lid = outer.cut(cavity)
 
-    # 3. Recess for sealing lip — a groove that accepts the bottom shell lip
-    lip_recess_l = inner_length - 2 * LIP_THICKNESS + 0.3  # 0.3 clearance
-    lip_recess_w = inner_width - 2 * LIP_THICKNESS + 0.3
-    lip_recess_r = max(inner_radius - LIP_THICKNESS, 0.3)
-    recess_outer = _rounded_box(inner_length + 0.3, inner_width + 0.3,
+    # Every subtractive tool is collected and removed with a single n-ary
+    # cut at the end (one PaveFiller over all tools, no per-primitive
+    # re-triangulation of the evolving lid).
+    subtractives: list[Part.Shape] = [cavity]
+
+    # 3. Recess for sealing lip — a groove that accepts the bottom shell lip.
+    # The region inside the groove is already removed by the cavity, so the
+    # full recess_outer block can be cut directly; no intermediate
+    # outer-minus-inner ring boolean is needed.
+    recess_outer = _rounded_box(inner_length + 0.3, inner_width + 0.3,  # 0.3 clearance
                                 LIP_HEIGHT, inner_radius, z_base)
-    recess_inner = _rounded_box(lip_recess_l, lip_recess_w, LIP_HEIGHT,
-                                lip_recess_r, z_base)
-    recess = recess_outer.cut(recess_inner)
-    # Cut this groove into the lid interior so the lip slots in
-    lid = lid.cut(recess)
+    subtractives.append(recess_outer)
 
     # 4. LED light-pipe hole (from top face, near one corner)
     led_x = OUTER_LENGTH / 2 - LED_OFFSET_FROM_EDGE
@@ -330,47 +513,30 @@ def build_lid() -> "Part.Shape":
     led_z = z_base + LID_HEIGHT - WALL_THICKNESS
     led_hole = _cylinder_hole(led_x, led_y, led_z, LED_HOLE_DIA,
                               WALL_THICKNESS * 2)
-    lid = lid.cut(led_hole)
+    subtractives.append(led_hole)
 
-    # 5. Snap-fit clip slots (rectangular cut-outs on inner long walls)
-    clip_positions_x = _distribute(NUM_CLIPS_PER_LONG_SIDE, OUTER_LENGTH,
-                                   CLIP_WIDTH)
+    # 5. Snap-fit clip slots (rectangular cut-outs on inner long walls).
+    # One prototype per wall side, translated along X for each clip.
     clearance = 0.3  # printing clearance
     for side_sign in (1, -1):
-        for cx in clip_positions_x:
-            slot_y_base = side_sign * (OUTER_WIDTH / 2 - WALL_THICKNESS)
-            slot = Part.makeBox(
-                CLIP_WIDTH + clearance,
-                CLIP_DEPTH + CLIP_THICKNESS + clearance,
-                CLIP_HEIGHT + clearance,
-                Base.Vector(
-                    cx - (CLIP_WIDTH + clearance) / 2,
-                    slot_y_base - ((CLIP_DEPTH + CLIP_THICKNESS + clearance) / 2
-                                   if side_sign > 0
-                                   else (CLIP_DEPTH + CLIP_THICKNESS
-                                         + clearance) / 2),
-                    z_base))
-            lid = lid.cut(slot)
+        slot_y_base = side_sign * (OUTER_WIDTH / 2 - WALL_THICKNESS)
+        slot_proto = Part.makeBox(
+            CLIP_WIDTH + clearance,
+            CLIP_DEPTH + CLIP_THICKNESS + clearance,
+            CLIP_HEIGHT + clearance,
+            Base.Vector(
+                -(CLIP_WIDTH + clearance) / 2,
+                slot_y_base - (CLIP_DEPTH + CLIP_THICKNESS + clearance) / 2,
+                z_base))
+        subtractives.extend(
+            slot_proto.translated(Base.Vector(cx, 0, 0))
+            for cx in CLIP_POSITIONS_X)
+
+    lid = _checked_boolean(outer, "cut", subtractives)
 
     return lid
 
 
-# ---------------------------------------------------------------------------
-# Utility
-# ---------------------------------------------------------------------------
-
-def _distribute(count: int, total_length: float,
-                item_width: float) -> list[float]:
-    """Return *count* evenly-spaced X positions centred on 0, with items of
-    *item_width* fitting comfortably inside *total_length*."""
-    if count == 1:
-        return [0.0]
-    usable = total_length - 2 * WALL_THICKNESS - item_width
-    spacing = usable / (count - 1)
-    start = -usable / 2
-    return [start + i * spacing for i in range(count)]
-
-
 # ---------------------------------------------------------------------------
 # Export helpers
 # ---------------------------------------------------------------------------
@@ -390,27 +556,55 @@ def export_shape(shape: "Part.Shape", name: str, directory: str) -> None:
     print(f"  STL  -> {stl_path}")
 
 
+# STL tessellation tolerance (mm).  0.25 mm matches typical FDM printer
+# resolution and still resolves the 1 mm vent slots and 3 mm LED hole;
+# tightening it further roughly doubles triangle count and mesh time per
+# halving.  Override with SENSEEDGE_STL_DEFLECTION=<mm>.
+_DEFAULT_STL_DEFLECTION = 0.25
+
+
 def export_shape_simple(shape: "Part.Shape", name: str,
                         directory: str) -> None:
     """Export STEP + STL without requiring an active FreeCAD document for the
-    STL (uses the shape tessellation directly)."""
+    STL (uses the shape tessellation directly).
+
+    Set SENSEEDGE_STEP_ONLY=1 to skip the STL tessellation entirely
+    (headless CI runs that only consume the STEP file), and
+    SENSEEDGE_STL_DEFLECTION to tune mesh quality vs. speed.
+    """
     step_path = os.path.join(directory, f"{name}.step")
     stl_path = os.path.join(directory, f"{name}.stl")
 
-    # STEP export
-    shape.exportStep(step_path)
-    print(f"  STEP -> {step_path}")
+    def _write_step() -> None:
+        shape.exportStep(step_path)
+        print(f"  STEP -> {step_path}")
+
+    if os.environ.get("SENSEEDGE_STEP_ONLY"):
+        _write_step()
+        print("  STL  skipped (SENSEEDGE_STEP_ONLY set)")
+        return
+
+    # The STEP writer and the STL mesher live in different OCCT subsystems
+    # and both release the GIL, so overlap the (I/O-heavy) STEP write with
+    # the (CPU-heavy) tessellation.
+    step_thread = threading.Thread(target=_write_step)
+    step_thread.start()
 
-    # STL export via mesh tessellation
+    # STL export via mesh tessellation (the dominant cost of a full export)
+    deflection = float(os.environ.get("SENSEEDGE_STL_DEFLECTION",
+                                      _DEFAULT_STL_DEFLECTION))
     try:
         import Mesh  # type: ignore[import-untyped]
         import MeshPart  # type: ignore[import-untyped]
-        mesh = MeshPart.meshFromShape(Shape=shape, LinearDeflection=0.1,
-                                      AngularDeflection=0.5)
+        mesh = MeshPart.meshFromShape(Shape=shape,
+                                      LinearDeflection=deflection,
+                                      AngularDeflection=0.7)
         mesh.write(stl_path)
         print(f"  STL  -> {stl_path}")
     except Exception as exc:
         print(f"  STL export skipped ({exc}); STEP file is available.")
+    finally:
+        step_thread.join()
 
 
 # ---------------------------------------------------------------------------
@@ -456,24 +650,51 @@ def main() -> None:
     # Ensure output directory exists
     os.makedirs(EXPORT_DIR, exist_ok=True)
 
-    # Create a FreeCAD document (required for some export paths)
-    doc = FreeCAD.newDocument("SenseEdge_Enclosure")
-
-    print("Building bottom shell ...")
-    bottom = build_bottom_shell()
-    bottom_obj = doc.addObject("Part::Feature", "SenseEdge_Bottom")
-    bottom_obj.Shape = bottom
-
-    print("Building top lid ...")
-    lid = build_lid()
-    lid_obj = doc.addObject("Part::Feature", "SenseEdge_Lid")
-    lid_obj.Shape = lid
-
-    doc.recompute()
-
+    # The two halves share no mutable state and the OCCT boolean kernel
+    # releases the GIL, so build them on two threads (threads rather than
+    # processes: OCCT shapes do not pickle across process boundaries).
+    print("Building bottom shell and top lid ...")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_bottom = ex.submit(build_bottom_shell)
+        fut_lid = ex.submit(build_lid)
+        bottom = fut_bottom.result()
+        lid = fut_lid.result()
+
+    # Single healing pass on the finished solids: merge the seam faces and
+    # edges left behind by the booleans (ShapeUpgrade_UnifySameDomain).
+    # Doing this once at the end is cheap and shrinks both the STEP output
+    # and the STL tessellation; doing it per-operation would be wasted work.
+    bottom = bottom.removeSplitter()
+    lid = lid.removeSplitter()
+
+    # Only materialize a document when a GUI is attached: recompute()
+    # triggers viewer tessellation of every Part::Feature, which is wasted
+    # work in headless runs where the raw shapes are exported directly.
+    if getattr(FreeCAD, "GuiUp", False):
+        doc = FreeCAD.newDocument("SenseEdge_Enclosure")
+        bottom_obj = doc.addObject("Part::Feature", "SenseEdge_Bottom")
+        bottom_obj.Shape = bottom
+        lid_obj = doc.addObject("Part::Feature", "SenseEdge_Lid")
+        lid_obj.Shape = lid
+        doc.recompute()
+
+    # Export both halves concurrently as well — each export already
+    # overlaps its own STEP write with its STL tessellation, so the four
+    # file writes progress in parallel on a multicore host.
     print("Exporting ...")
-    export_shape_simple(bottom, "senseedge_bottom", EXPORT_DIR)
-    export_shape_simple(lid, "senseedge_lid", EXPORT_DIR)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        for fut in (ex.submit(export_shape_simple, bottom,
+                              "senseedge_bottom", EXPORT_DIR),
+                    ex.submit(export_shape_simple, lid,
+                              "senseedge_lid", EXPORT_DIR)):
+            fut.result()
+
+    # Combined assembly: both halves through one STEP writer instance
+    # (one header/context setup instead of two) and a single-file
+    # deliverable for CAD reviewers.
+    assembly_path = os.path.join(EXPORT_DIR, "senseedge_enclosure.step")
+    Part.makeCompound([bottom, lid]).exportStep(assembly_path)
+    print(f"  STEP -> {assembly_path}")
 
     print()
     print("Done.  Files written to:", EXPORT_DIR)